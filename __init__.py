@@ -2,11 +2,11 @@ from os.path import exists
 from os import makedirs 
 import pandas as pd
     
-makedirs(".tmp", exist_ok=True)
 makedirs(".data", exist_ok=True)
+makedirs(".cache", exist_ok=True)
 
-html_path = ".tmp/index.html"
 symbols_path = ".data/symbols.csv"
+cache_path = ".cache"
 
 
 if not exists(symbols_path):
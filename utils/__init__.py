@@ -1,3 +1,3 @@
-from utils.data import load_data
+from utils.data import load_data, load_many
 
 
@@ -1,11 +1,55 @@
+import codecs
+import csv
+import gzip
+import hashlib
+import numbers
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import timedelta
 from datetime import datetime
-from typing import Optional, Tuple, Union
-from bs4 import BeautifulSoup
+from email.message import Message
+from typing import Dict, List, Optional, Tuple, Union
+import lxml.html
+from lxml import etree
+import numpy as np
+import orjson
 import pandas as pd
-from os.path import exists
+from glob import glob
+from io import StringIO
+from os import makedirs, remove, replace
+from os.path import exists, getmtime
 import requests
-from __init__ import headers
+from requests.adapters import HTTPAdapter
+from __init__ import cache_path, headers, symbols_path
+
+history_table = etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' table ')]")
+table_rows = etree.XPath(".//tr")
+row_cells = etree.XPath("td")
+symbol_found = etree.XPath("boolean(//span[contains(concat(' ', normalize-space(@class), ' '), ' ellipsis ')])")
+about_text = etree.XPath("string(//h1[contains(@class, 'yf-xxbei9')])")
+
+price_columns = ["Open", "High", "Low", "Close", "Adj Close"]
+price_dtypes = {column: np.float32 for column in price_columns}
+
+symbols: Optional[Dict[str, str]] = None
+symbols_lock = threading.RLock()
+
+max_connections = 16
+# Bounds in-flight Yahoo requests across threads to stay under its throttling.
+yahoo_requests = threading.Semaphore(8)
+cache_expiry = timedelta(hours=6)
+download_chunk_size = 64 * 1024
+
+session = requests.Session()
+session.headers.update(headers)
+adapter = HTTPAdapter(pool_connections=max_connections,
+                      pool_maxsize=max_connections)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
 
 
 def search_in_web(symbol: str) -> Union[str, None]:
@@ -16,68 +60,242 @@ def search_in_web(symbol: str) -> Union[str, None]:
         symbol (str): The stock symbol (ticker) to search for.
 
     Returns:
-        str or None: The company description if found, otherwise None.
+        str or None: The company description if found, otherwise None (also for an empty
+                     or unparseable page).
     """
     url = f"https://finance.yahoo.com/quote/{symbol}/"
     response = download_web(url)
-    soup = load_html_page(response)
-    if soup.find("span", attrs={"class": "ellipsis"}) is None:
+    try:
+        tree = parse_html(response)
+    except etree.ParserError:
+        # Yahoo answers errors and throttling with an empty body.
+        return None
+    if not symbol_found(tree):
         return None
     else:
-        about = soup.find("h1", attrs={"class": "yf-xxbei9"}).text
-    return about
+        about = about_text(tree)
+    return about or None
+
+
+def cache_file(url: str) -> str:
+    """
+    Returns the path of the on-disk cache entry for a URL.
+
+    Args:
+        url (str): The requested URL.
+
+    Returns:
+        str: The path of the gzip-compressed response body.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return f"{cache_path}/{key}.gz"
+
+
+def read_cache(url: str) -> Optional[bytes]:
+    """
+    Reads a cached response body for a URL if it is younger than `cache_expiry`.
+
+    Args:
+        url (str): The requested URL.
+
+    Returns:
+        bytes or None: The response body, or None if it is not cached or has expired.
+    """
+    file_path = cache_file(url)
+    if not exists(file_path):
+        return None
+    try:
+        if time.time() - getmtime(file_path) > cache_expiry.total_seconds():
+            return None
+        with open(file_path, "rb") as f:
+            # A file cut off inside the gzip header decompresses to b"" instead of raising.
+            return gzip.decompress(f.read()) or None
+    except (OSError, EOFError, zlib.error):
+        # A missing or corrupt entry is treated as a miss and gets rewritten.
+        return None
 
 
-def download_web(url: str) -> str:
+def write_cache(url: str, content: bytes) -> None:
+    """
+    Stores a response body for a URL in the on-disk cache.
+
+    The body is written to a temporary file first and then moved into place, so readers
+    never see a partially written entry.
+
+    Args:
+        url (str): The requested URL.
+        content (bytes): The response body.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(gzip.compress(content))
+        replace(tmp_path, cache_file(url))
+    except BaseException:
+        remove(tmp_path)
+        raise
+
+
+def http_get(url: str) -> requests.Response:
+    """
+    Sends a GET request through the shared session, limiting how many run at once.
+
+    Args:
+        url (str): The URL to request.
+
+    Returns:
+        requests.Response: The response.
+    """
+    with yahoo_requests:
+        return session.get(url)
+
+
+def response_charset(response: requests.Response) -> str:
+    """
+    Returns the charset declared in a response's Content-Type header.
+
+    Args:
+        response (requests.Response): The response.
+
+    Returns:
+        str: The normalized codec name of the declared charset, or "utf-8" if none is declared
+             or it is not a known codec.
+    """
+    message = Message()
+    message["Content-Type"] = response.headers.get("Content-Type", "")
+    try:
+        return codecs.lookup(message.get_content_charset() or "utf-8").name
+    except LookupError:
+        return "utf-8"
+
+
+def download_web(url: str, until: Optional[bytes] = None) -> bytes:
     """
     Downloads the content of a webpage from the specified URL.
 
+    The body is streamed in chunks. If `until` is given, the download stops as soon as that
+    marker has been received, so the rest of the page (mostly scripts) is never transferred.
+    Successful responses are cached on disk, so the same URL is not requested again
+    until the cache entry expires.
+
     Args:
         url (str): The URL of the webpage to download.
+        until (bytes or None): A marker after which the rest of the page is not needed.
 
     Returns:
-        str: The HTML content of the webpage.
+        bytes: The HTML content of the webpage, encoded as UTF-8.
     """
-    response = requests.get(url, headers=headers)
-    return response.text
+    content = read_cache(url)
+    if content is not None:
+        return content
+    buffer = bytearray()
+    with yahoo_requests, session.get(url, stream=True) as response:
+        for chunk in response.iter_content(chunk_size=download_chunk_size):
+            searched = max(0, len(buffer) - len(until)) if until else 0
+            buffer += chunk
+            if until and buffer.find(until, searched) != -1:
+                break
+        status_code = response.status_code
+        charset = response_charset(response)
+    content = bytes(buffer)
+    if charset != "utf-8":
+        content = content.decode(charset, errors="replace").encode("utf-8")
+    if status_code == 200 and content:
+        write_cache(url, content)
+    return content
+
+
+@lru_cache(maxsize=None)
+def html_parser(encoding: str) -> lxml.html.HTMLParser:
+    """
+    Returns a shared lxml HTML parser for an encoding.
 
+    Args:
+        encoding (str): The encoding of the documents to parse.
 
-def load_html_page(text: str) -> BeautifulSoup:
+    Returns:
+        lxml.html.HTMLParser: The parser.
     """
-    Loads an HTML page either from a file or raw HTML text.
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+def parse_html(text: Union[bytes, str], encoding: str = "utf-8") -> lxml.html.HtmlElement:
+    """
+    Parses raw HTML text.
+
+    Bytes are handed to lxml as-is with their encoding stated explicitly; otherwise lxml falls
+    back to Latin-1 for pages without a <meta charset>.
 
     Args:
-        text (str): The raw HTML content or a file path to load the HTML content.
+        text (bytes or str): The raw HTML content.
+        encoding (str): The encoding of `text` when it is bytes (default is "utf-8").
 
     Returns:
-        BeautifulSoup: The parsed HTML content as a BeautifulSoup object.
+        lxml.html.HtmlElement: The root element of the parsed page.
     """
-    if exists(text):
-        with open(text, "r", encoding="utf-8") as f:
-            html_doc = f.read()
-    else:
-        html_doc = text
-    soup = BeautifulSoup(html_doc, 'html.parser')
-    return soup
+    if isinstance(text, str):
+        text = text.encode(encoding)
+    return lxml.html.fromstring(text, parser=html_parser(encoding))
+
+
+def load_html_file(file_path: str, encoding: str = "utf-8") -> lxml.html.HtmlElement:
+    """
+    Loads and parses an HTML page saved to a file.
+
+    Args:
+        file_path (str): The path of the HTML file.
+        encoding (str): The encoding of the file (default is "utf-8").
 
+    Returns:
+        lxml.html.HtmlElement: The root element of the parsed page.
+    """
+    return lxml.html.parse(file_path, parser=html_parser(encoding)).getroot()
 
-def check_in_file(df: pd.DataFrame, symbol: str) -> Tuple[bool, Optional[str]]:
+
+def load_symbols() -> Dict[str, str]:
     """
-    Checks if the symbol exists in the provided dataframe.
+    Returns the known symbols, reading the local symbols file on first use.
+
+    Returns:
+        dict: A mapping from symbol to its 'About' description.
+    """
+    global symbols
+    with symbols_lock:
+        if symbols is None:
+            df = pd.read_csv(symbols_path, index_col="symbol")
+            symbols = df["about"].to_dict()
+    return symbols
+
+
+def save_symbol(symbol: str, about: str) -> None:
+    """
+    Records a newly found symbol in memory and appends it to the local symbols file.
 
     Args:
-        df (pd.DataFrame): The dataframe containing symbol data.
+        symbol (str): The stock symbol.
+        about (str): The company description of the symbol.
+    """
+    with symbols_lock:
+        load_symbols()[symbol] = about
+        with open(symbols_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerow([symbol, about])
+
+
+def check_in_file(symbols: Dict[str, str], symbol: str) -> Tuple[bool, Optional[str]]:
+    """
+    Checks if the symbol exists in the provided symbol mapping.
+
+    Args:
+        symbols (dict): A mapping from symbol to its 'About' description.
         symbol (str): The stock symbol to check.
 
     Returns:
         tuple: A tuple containing a boolean indicating if the symbol was found,
                and the corresponding 'About' field if found, otherwise None.
     """
-    try:
-        index = df.loc[symbol]
-        return True, index["About"]
-    except KeyError:
-        return False, None
+    if symbol in symbols:
+        return True, symbols[symbol]
+    return False, None
 
 
 def check_symbol(symbol: str) -> bool:
@@ -85,6 +303,8 @@ def check_symbol(symbol: str) -> bool:
     Checks if a stock symbol exists either in the local data file or on the web.
     If the symbol is found on the web, it is added to the local data file.
 
+    The local file is read once per process; new symbols are appended to it one line at a time.
+
     Args:
         symbol (str): The stock symbol to check.
 
@@ -92,71 +312,121 @@ def check_symbol(symbol: str) -> bool:
         bool: True if the symbol exists, otherwise False.
     """
     symbol = symbol.lower()
-    symbol_path = ".data/symbols.csv"
-    df = pd.read_csv(symbol_path, index_col="symbol")
+    known = load_symbols()
 
-    in_file, about = check_in_file(df, symbol)
+    in_file, about = check_in_file(known, symbol)
     if in_file:
         return True
     else:
         in_web = search_in_web(symbol)
         if in_web is not None:
-            df.loc[symbol] = in_web
-            df.to_csv(symbol_path)
+            save_symbol(symbol, in_web)
             return True
         else:
             return False
 
 
-def process_data(soup: BeautifulSoup) -> pd.DataFrame:
+def downcast_volume(volume: np.ndarray) -> np.ndarray:
+    """
+    Narrows a volume column to int32 when every value fits, otherwise keeps it as int64.
+
+    Args:
+        volume (np.ndarray): The traded volumes.
+
+    Returns:
+        np.ndarray: The volumes with the smallest integer dtype that holds them.
+    """
+    volume = volume.astype(np.int64)
+    limits = np.iinfo(np.int32)
+    if volume.size == 0 or (volume.min() >= limits.min and volume.max() <= limits.max):
+        return volume.astype(np.int32)
+    return volume
+
+
+def process_data(tree: lxml.html.HtmlElement) -> pd.DataFrame:
     """
-    Processes the HTML soup object to extract and organize historical stock data into a DataFrame.
+    Processes the parsed HTML page to extract and organize historical stock data into a DataFrame.
 
-    This function processes a BeautifulSoup object representing the HTML content of a stock's historical data page.
+    This function processes the lxml tree of a stock's historical data page.
     It extracts the relevant stock data from the table, cleans and formats it, and returns it as a pandas DataFrame.
 
     Args:
-        soup (BeautifulSoup): A BeautifulSoup object containing the parsed HTML content of the page.
+        tree (lxml.html.HtmlElement): The root element of the parsed page.
 
     Returns:
         pd.DataFrame: A DataFrame containing the historical stock data with columns for Date, Open, High, Low, Close,
                       Adj Close, and Volume. The 'Date' column is set as the index, and numerical columns are cast to
-                      appropriate data types (float for stock data and int for volume).
+                      appropriate data types (float32 for stock data and int32 for volume, or int64
+                      when a volume does not fit).
     """
 
-    def preprocess(cell: str) -> str:
-        """ 
-        Cleans and formats the content of a table cell by stripping whitespace and removing commas.
-
-        This function processes a single table cell's content by removing unwanted spaces and commas, 
-        ensuring that the data is clean and ready for further processing or conversion to a numerical type.
+    headers = "Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"
+    table = history_table(tree)[0]
+    rows = [[td.text_content().strip() for td in row_cells(tr)]
+            for tr in table_rows(table)[1:]]
+    # Dividend and split rows span fewer cells than a price row.
+    rows = [row for row in rows if len(row) == len(headers)]
+
+    # Hand the cells to pandas' C tokenizer, which strips thousands separators and
+    # converts to numbers in one pass instead of per-cell Python calls.
+    text = "\n".join("\t".join(row) for row in [headers, *rows])
+    df = pd.read_csv(StringIO(text), sep="\t", thousands=",",
+                     dtype={"Date": str, **price_dtypes, "Volume": np.int64})
+    df["Date"] = pd.to_datetime(df["Date"])
+    df["Volume"] = downcast_volume(df["Volume"].to_numpy())
+    df.set_index("Date", inplace=True)
+    df.sort_index(inplace=True)
+    return df
 
-        Args:
-            cell (Tag): A BeautifulSoup Tag object representing a table cell (i.e., <td> element).
 
-        Returns:
-            str: The cleaned text content of the table cell, with leading/trailing whitespace removed and commas removed.
-        """
-        cell = cell.text.strip()
-        cell = str.replace(cell, ",", "")
-        return cell
+def fetch_chart(symbol: str, start_timestamp: int, end_timestamp: int) -> Optional[pd.DataFrame]:
+    """
+    Fetches daily historical stock data from the Yahoo Finance chart JSON endpoint.
 
-    table = soup.find(attrs={"class": "table"})
-    rows = []
-    for tr in table.find_all("tr")[1:]:
-        cells = tr.find_all("td")
-        row = [preprocess(cell) for cell in cells]
-        if len(row) < 3:
-            continue
-        else:
-            rows.append(row)
+    Args:
+        symbol (str): The stock symbol.
+        start_timestamp (int): The start of the range as a Unix timestamp.
+        end_timestamp (int): The end of the range as a Unix timestamp.
 
-    headers = "Date", "Open", "High", "Low", "Close", "Adj Close", "Volume"
-    df = pd.DataFrame(rows, columns=headers)
-    df['Date'] = pd.to_datetime(df['Date'])
-    df[["Open", "High", "Low", "Close", "Adj Close"]] = df[[
-        "Open", "High", "Low", "Close", "Adj Close"]].astype(float)
-    df[["Volume"]] = df[["Volume"]].astype(int)
+    Returns:
+        pd.DataFrame or None: The historical stock data indexed by Date, or None if the endpoint
+                              refused the request or returned no usable data.
+    """
+    url = (f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+           f"?period1={start_timestamp}&period2={end_timestamp}&interval=1d&events=history")
+    content = read_cache(url)
+    cached = content is not None
+    if not cached:
+        response = http_get(url)
+        if response.status_code != 200 or "consent" in response.url:
+            return None
+        content = response.content
+    try:
+        result = orjson.loads(content)["chart"]["result"][0]
+        timestamps = result["timestamp"]
+        quote = result["indicators"]["quote"][0]
+        adjclose = result["indicators"]["adjclose"][0]["adjclose"]
+        offset = result["meta"].get("gmtoffset", 0)
+    except (orjson.JSONDecodeError, KeyError, IndexError, TypeError):
+        return None
+    if not cached:
+        write_cache(url, content)
+
+    # Build every column with its final dtype; missing values (None) become NaN.
+    dates = pd.to_datetime(np.asarray(timestamps, dtype=np.int64) + offset, unit="s").normalize()
+    values = [quote["open"], quote["high"], quote["low"], quote["close"], adjclose]
+    columns = {column: np.asarray(value, dtype=price_dtypes[column])
+               for column, value in zip(price_columns, values)}
+    volume = np.asarray(quote["volume"], dtype=np.float64)
+
+    valid = ~np.isnan(volume)
+    for column in columns.values():
+        valid &= ~np.isnan(column)
+    df = pd.DataFrame.from_dict({
+        "Date": dates[valid],
+        **{column: array[valid] for column, array in columns.items()},
+        "Volume": downcast_volume(volume[valid]),
+    }, orient="columns")
     df.set_index("Date", inplace=True)
     df.sort_index(inplace=True)
     return df
@@ -166,6 +436,8 @@ def fetch_data(symbol: str, start_date: str, end_date: str) -> Optional[pd.DataF
     """
     Fetches historical stock data for a given symbol within a specified date range.
 
+    The chart JSON endpoint is tried first; the HTML history page is scraped only if it fails.
+
     Args:
         symbol (str): The stock symbol.
         start_date (str or None): The start date in "YYYY-MM-DD" format or None for default.
@@ -185,49 +457,211 @@ def fetch_data(symbol: str, start_date: str, end_date: str) -> Optional[pd.DataF
     end_timestamp = date_to_strptime(end_date)
     if start_timestamp >= end_timestamp:
         return None
+
+    df = fetch_chart(symbol, start_timestamp, end_timestamp)
+    if df is not None:
+        return df
+
     url = f"https://finance.yahoo.com/quote/{symbol}/history/?period1={start_timestamp}&period2={end_timestamp}"
 
-    response = download_web(url)
-    soup = load_html_page(response)
-    df = process_data(soup)
+    response = download_web(url, until=b"</table>")
+    tree = parse_html(response)
+    df = process_data(tree)
 
     return df
 
 
-def date_to_strptime(date: Union[str, int]) -> int:
+@lru_cache(maxsize=1024)
+def date_to_strptime(date: Union[str, int, datetime.date]) -> int:
     """
-    Converts a date (string or numeric) to a Unix timestamp.
+    Converts a date (string, date or numeric) to a Unix timestamp.
 
     Args:
-        date (str or int): The date to convert.
+        date (str, int or datetime.date): The date to convert.
 
     Returns:
         int: The Unix timestamp of the provided date.
     """
-    if str.isnumeric(str(date)):
+    if isinstance(date, numbers.Real):
         return int(date)
+    if isinstance(date, datetime):
+        return int(date.timestamp())
+    if isinstance(date, str):
+        if date.isnumeric():
+            return int(date)
+        return int(datetime.fromisoformat(date).timestamp())
+    return int(datetime(date.year, date.month, date.day).timestamp())
+
+
+def data_path(symbol: str) -> str:
+    """
+    Returns the directory of the local store for a stock symbol.
+
+    Args:
+        symbol (str): The stock symbol.
+
+    Returns:
+        str: The directory holding one Feather file per year of the symbol's historical data.
+    """
+    return f".data/{symbol}"
+
+
+def partition_path(symbol: str, year: int) -> str:
+    """
+    Returns the path of one year's partition in the local store of a stock symbol.
+
+    Args:
+        symbol (str): The stock symbol.
+        year (int): The calendar year of the partition.
+
+    Returns:
+        str: The path of the Feather file for that year.
+    """
+    return f"{data_path(symbol)}/{year}.feather"
+
 
-    if not isinstance(date, str):
-        date = str(date)
-    date_obj = datetime.strptime(date, "%Y-%m-%d")
-    return int(date_obj.timestamp())
+def partition_files(symbol: str) -> List[str]:
+    """
+    Lists the yearly partitions in the local store of a stock symbol.
+
+    Args:
+        symbol (str): The stock symbol.
+
+    Returns:
+        list of str: The partition paths in chronological order; empty if nothing is stored.
+    """
+    return sorted(glob(f"{data_path(symbol)}/*.feather"))
+
+
+def read_partition(file_path: str) -> pd.DataFrame:
+    """
+    Reads a single Feather partition.
+
+    Args:
+        file_path (str): The path of the partition.
+
+    Returns:
+        pd.DataFrame: The historical stock data in the partition, indexed by Date.
+    """
+    df = pd.read_feather(file_path)
+    df.set_index("Date", inplace=True)
+    return df
 
 
-def save_html_page(content: str, file_path: str = ".tmp/index.html") -> None:
+def read_store(symbol: str) -> pd.DataFrame:
     """
-    Saves HTML content to a file.
+    Reads the locally stored historical data for a stock symbol.
 
     Args:
-        content (str): The HTML content to save.
-        file_path (str): The path where the HTML file should be saved (default is ".tmp/index.html").
+        symbol (str): The stock symbol to read data for.
+
+    Returns:
+        pd.DataFrame: The historical stock data, indexed by Date.
     """
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    return pd.concat([read_partition(file) for file in partition_files(symbol)], axis=0)
+
+
+def write_store(symbol: str, df: pd.DataFrame) -> None:
+    """
+    Writes the historical data for a stock symbol to the local store, one file per year.
+
+    Args:
+        symbol (str): The stock symbol to write data for.
+        df (pd.DataFrame): The historical stock data, indexed by Date.
+    """
+    makedirs(data_path(symbol), exist_ok=True)
+    for year, part in df.groupby(df.index.year):
+        part.reset_index().to_feather(partition_path(symbol, year))
+
+
+def append_store(symbol: str, df: pd.DataFrame) -> None:
+    """
+    Adds new rows to the local store of a stock symbol, rewriting only the years they fall in.
+
+    Args:
+        symbol (str): The stock symbol to write data for.
+        df (pd.DataFrame): The new historical stock data, indexed by Date.
+    """
+    makedirs(data_path(symbol), exist_ok=True)
+    for year, part in df.groupby(df.index.year):
+        file_path = partition_path(symbol, year)
+        if exists(file_path):
+            part = pd.concat([read_partition(file_path), part], axis=0)
+            part = part[~part.index.duplicated(keep="last")]
+            part.sort_index(inplace=True)
+        part.reset_index().to_feather(file_path)
+
+
+def last_stored_date(symbol: str) -> datetime.date:
+    """
+    Returns the most recent date in the local store of a stock symbol.
+
+    Only the latest year's partition is read.
+
+    Args:
+        symbol (str): The stock symbol.
+
+    Returns:
+        datetime.date: The last stored trading day.
+    """
+    last_file = partition_files(symbol)[-1]
+    return read_partition(last_file).index.max().date()
+
+
+def migrate_store(symbol: str) -> None:
+    """
+    Converts an older single-file store (CSV or Feather) of a stock symbol to the yearly layout.
+
+    Both legacy files are removed afterwards, so a stale copy is never imported again.
+
+    Args:
+        symbol (str): The stock symbol.
+    """
+    csv_path = f".data/{symbol}.csv"
+    feather_path = f".data/{symbol}.feather"
+    if exists(feather_path):
+        df = read_partition(feather_path)
+    elif exists(csv_path):
+        df = pd.read_csv(csv_path, index_col="Date",
+                         parse_dates=True, date_format="%Y-%m-%d",
+                         dtype=price_dtypes)
+        df["Volume"] = downcast_volume(df["Volume"].to_numpy())
+    else:
+        return
+    write_store(symbol, df)
+    for legacy_path in (feather_path, csv_path):
+        if exists(legacy_path):
+            remove(legacy_path)
+
+
+def export_csv(symbol: str, file_path: Optional[str] = None) -> str:
+    """
+    Exports the locally stored historical data for a stock symbol to a CSV file.
+
+    Args:
+        symbol (str): The stock symbol to export.
+        file_path (str or None): The destination path, or None for "{symbol}.csv" in the working
+                                 directory. Exports are kept out of ".data/", where "{symbol}.csv"
+                                 would be taken for an older price store.
+
+    Returns:
+        str: The path of the written CSV file.
+
+    Raises:
+        KeyError: If no data is stored for the symbol.
+    """
+    symbol = symbol.lower()
+    if not partition_files(symbol):
+        raise KeyError(symbol)
+    if file_path is None:
+        file_path = f"{symbol}.csv"
+    read_store(symbol).to_csv(file_path)
+    return file_path
 
 
 def download_data(symbol: str) -> pd.DataFrame:
     """
-    Downloads historical data for a stock symbol and saves it to a CSV file.
+    Downloads historical data for a stock symbol and saves it to the local store.
 
     Args:
         symbol (str): The stock symbol to download data for.
@@ -242,7 +676,7 @@ def download_data(symbol: str) -> pd.DataFrame:
         start_date = "2000-01-01"
         end_date = datetime.now().date()
         df = fetch_data(symbol, start_date, end_date)
-        df.to_csv(f".data/{symbol}.csv")
+        write_store(symbol, df)
         return df
     else:
         raise KeyError
@@ -252,27 +686,21 @@ def update_data(symbol: str) -> pd.DataFrame:
     """
     Updates the historical stock data for a given symbol if new data is available.
 
+    New rows are written into the yearly partitions they belong to; older years are not rewritten.
+
     Args:
         symbol (str): The stock symbol to update data for.
 
     Returns:
         pd.DataFrame: The updated historical stock data.
     """
-    file_path = f".data/{symbol}.csv"
-    df = pd.read_csv(file_path, index_col="Date",
-                     parse_dates=True, date_format="%Y-%m-%d")
     now = datetime.now().date()
-    last_date = df.index.max().date()
-    if now == last_date:
-        return df
-    else:
+    last_date = last_stored_date(symbol)
+    if now != last_date:
         df2 = fetch_data(symbol, last_date, now)
-
-        df = pd.concat([df, df2], axis=0)
-        df.sort_index(inplace=True)
-        df.drop_duplicates(inplace=True)
-        df.to_csv(f".data/{symbol}.csv")
-    return df
+        if df2 is not None and not df2.empty:
+            append_store(symbol, df2)
+    return read_store(symbol)
 
 
 def last_trading_day(date: datetime.date) -> datetime.date:
@@ -285,14 +713,8 @@ def last_trading_day(date: datetime.date) -> datetime.date:
     Returns:
         datetime.date: The last trading day before the given date.
     """
-    def is_weekend(date: datetime.date) -> bool:
-        return date.weekday() >= 5
-
-    current_date = date
-
-    while is_weekend(current_date):
-        current_date -= timedelta(days=1)
-    return current_date
+    # Saturday (5) steps back one day and Sunday (6) two, landing on Friday (4).
+    return date - timedelta(days=max(0, date.weekday() - 4))
 
 
 def load_data(symbol: str) -> pd.DataFrame:
@@ -307,10 +729,29 @@ def load_data(symbol: str) -> pd.DataFrame:
         pd.DataFrame: The historical stock data for the symbol.
     """
     symbol = symbol.lower()
-    file_path = f".data/{symbol}.csv"
-    if exists(file_path):
+    if not partition_files(symbol):
+        migrate_store(symbol)
+    if partition_files(symbol):
         df = update_data(symbol)
         return df
     else:
         df = download_data(symbol)
         return df
+
+
+def load_many(symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Loads historical stock data for several symbols concurrently.
+
+    Symbols differing only in case are loaded once, so two workers never write the same store.
+
+    Args:
+        symbols (list of str): The stock symbols to load data for.
+
+    Returns:
+        dict: A mapping from each symbol, as given, to its historical stock data.
+    """
+    unique = list(dict.fromkeys(symbol.lower() for symbol in symbols))
+    with ThreadPoolExecutor(max_workers=max_connections) as executor:
+        loaded = dict(zip(unique, executor.map(load_data, unique)))
+    return {symbol: loaded[symbol.lower()] for symbol in symbols}